@@ -1,22 +1,58 @@
+import os
+import sys
+
+from collections import deque
 from pathlib import Path
 from typing import Dict
 from typing import List
 from typing import Optional
 from typing import Iterator
+from typing import Tuple
 from typing import Union
 
 
+def _index_seq(seq: Union[list, dict]) -> Tuple[List[str], Dict[str, str]]:
+    """
+    Walk a sequence of embedded sequences once and return a tuple of:
+
+    - a plain list of chapters (same as flatten_seq),
+    - a dictionary with key = chapter, value = chapter title ('' if the
+      chapter is defined without a title).
+    """
+
+    result: List[str] = []
+    titles: Dict[str, str] = {}
+    # children are pushed in reverse so that they are popped in original order
+    stack = deque([seq])
+    # bind methods to locals to skip attribute lookups in the loop
+    pop, push = stack.pop, stack.extend
+    append, set_title = result.append, titles.setdefault
+    # chapter paths are interned to make lookups in sets and dicts cheaper
+    intern = sys.intern
+    while stack:
+        i = pop()
+        if isinstance(i, str):
+            # sys.intern accepts only exact str, not subclasses
+            if type(i) is str:
+                i = intern(i)
+            append(i)
+            set_title(i, '')
+        elif isinstance(i, list):
+            push(reversed(i))
+        elif isinstance(i, dict):
+            for title, chapter in i.items():
+                if type(chapter) is str:
+                    set_title(intern(chapter), title)
+                elif isinstance(chapter, str):
+                    set_title(chapter, title)
+            push(reversed(list(i.values())))
+    return result, titles
+
+
 def flatten_seq(seq: Union[list, dict]) -> list:
     """convert a sequence of embedded sequences into a plain list"""
 
-    result = []
-    vals = seq.values() if isinstance(seq, dict) else seq
-    for i in vals:
-        if isinstance(i, (dict, list)):
-            result.extend(flatten_seq(i))
-        elif isinstance(i, str):
-            result.append(i)
-    return result
+    return _index_seq(seq)[0]
 
 
 class ChapterNotFoundError(Exception):
@@ -35,10 +71,10 @@ class Chapters:
                  working_dir: Optional[Union[str, Path]] = None,
                  src_dir: Optional[Union[str, Path]] = None,
                  ):
-        self.working_dir = Path(working_dir).resolve() if working_dir else None
-        self.src_dir = Path(src_dir).resolve() if src_dir else None
-        self._chapters = chapters
-        self._flat = flatten_seq(chapters)
+        self._by_abs: Dict[Path, str] = {}
+        self.working_dir = working_dir  # type: ignore
+        self.src_dir = src_dir  # type: ignore
+        self.chapters = chapters
 
     def __len__(self) -> int:
         return len(self._flat)
@@ -47,7 +83,7 @@ class Chapters:
         return self._flat[ind]
 
     def __contains__(self, item: str) -> bool:
-        return item in self._flat
+        return item in self._flat_set
 
     def __iter__(self):
         return iter(self._flat)
@@ -72,7 +108,31 @@ class Chapters:
     @chapters.setter
     def chapters(self, chapters) -> None:
         self._chapters = chapters
-        self._flat = flatten_seq(chapters)
+        self._flat, self._titles = _index_seq(chapters)
+        self._flat_set = set(self._flat)
+        self._by_abs.clear()
+
+    @property
+    def working_dir(self) -> Optional[Path]:
+        """Resolved path to the working dir"""
+        return self._working_dir
+
+    @working_dir.setter
+    def working_dir(self, working_dir: Optional[Union[str, Path]]) -> None:
+        self._working_dir = Path(working_dir).resolve() if working_dir else None
+        self._working_prefix = os.path.join(self._working_dir, '') if self._working_dir else None
+        self._by_abs.clear()
+
+    @property
+    def src_dir(self) -> Optional[Path]:
+        """Resolved path to the src dir"""
+        return self._src_dir
+
+    @src_dir.setter
+    def src_dir(self, src_dir: Optional[Union[str, Path]]) -> None:
+        self._src_dir = Path(src_dir).resolve() if src_dir else None
+        self._src_prefix = os.path.join(self._src_dir, '') if self._src_dir else None
+        self._by_abs.clear()
 
     @property
     def flat(self) -> list:
@@ -85,14 +145,18 @@ class Chapters:
         one of those — return relative path to file (as it is stated in chapters)
         """
         abs_path = Path(filepath).resolve()
-        if self.working_dir and self.working_dir in abs_path.parents:
-            chapter_path = str(abs_path.relative_to(self.working_dir))
-        if self.src_dir and self.src_dir in abs_path.parents:
-            chapter_path = str(abs_path.relative_to(self.src_dir))
-        if chapter_path and chapter_path in self.chapters:
+        if abs_path in self._by_abs:
+            return self._by_abs[abs_path]
+        str_path = str(abs_path)
+        chapter_path = None
+        if self._working_prefix and str_path.startswith(self._working_prefix):
+            chapter_path = sys.intern(str_path[len(self._working_prefix):])
+        elif self._src_prefix and str_path.startswith(self._src_prefix):
+            chapter_path = sys.intern(str_path[len(self._src_prefix):])
+        if chapter_path is not None and chapter_path in self._flat_set:
+            self._by_abs[abs_path] = chapter_path
             return chapter_path
-        else:
-            raise ChapterNotFoundError(f'{filepath} is not in the chapter list')
+        raise ChapterNotFoundError(f'{filepath} is not in the chapter list')
 
     def paths(self, parent_dir: Union[str, Path]) -> Iterator:
         """
@@ -133,32 +197,7 @@ class Chapters:
 
         :returns: chapter title or empty string.
         """
-        def find_chapter(chapters: Union[list, dict], to_find: str) -> Union[str, dict, None]:
-            if isinstance(chapters, list):
-                for i in chapters:
-                    if isinstance(i, (list, dict)):
-                        found = find_chapter(i, to_find)
-                        if found:
-                            return found
-                    elif isinstance(i, str) and i == to_find:
-                        return i
-            elif isinstance(chapters, dict):
-                val = next(iter(chapters.values()))
-                if isinstance(val, str) and val == to_find:
-                    return chapters
-                else:
-                    found = find_chapter(val, to_find)
-                    if found:
-                        return found
-            elif isinstance(chapters, str):
-                if chapters == to_find:
-                    return chapters
-            return None
-
-        chapter = find_chapter(self.chapters, chapter_path)
-        if chapter is None:
+        try:
+            return self._titles[chapter_path]
+        except KeyError:
             raise ChapterNotFoundError(f'{chapter_path} is not in the chapter list')
-        if isinstance(chapter, str):
-            return ''
-        elif isinstance(chapter, dict):
-            return next(iter(chapter.keys()))
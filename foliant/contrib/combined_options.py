@@ -1,16 +1,17 @@
 import yaml
 
 from collections import OrderedDict
-from copy import deepcopy
 from pathlib import Path
 from typing import Any
 from typing import Callable
 from typing import Collection
 from typing import Sequence
 from typing import Dict
+from typing import FrozenSet
 from typing import List
 from typing import Optional
 from typing import Union
+from typing import cast
 
 class ValidationError(Exception):
     '''Error for validations when validation is failed'''
@@ -52,6 +53,7 @@ class Options:
         self._validators = dict(validators) if validators else {}
         self._convertors = dict(convertors) if convertors else {}
         self._required = list(required) if required else []
+        self._required_sets = self._get_required_sets()
         self.validate()
         self._convert()
 
@@ -67,31 +69,51 @@ class Options:
         Raises ValidationError if any of validation checks fails.
         Raises RequiredParamsMissingError if required params are not supplied.
         '''
-        def _check_required(combination: Collection) -> bool:
-            for param in combination:
-                if param not in self.options:
-                    return False
-            return True
-
-        for key in self._validators:
-            if key in self.options:
-                try:
-                    self._validators[key](self.options[key])
-                except ValidationError as e:
-                    raise ValidationError(f'Error in option "{key}": {e}')
-        if self._required:
-            if isinstance(self._required[0], str):
-                if not _check_required(self._required):
-                    raise RequiredParamsMissingError(
-                        f'Not all required params are supplied: {self._required}')
-            else:  # several combinations of required params are possible
-                check_result = any(_check_required(comb) for comb in self._required)
-                if not check_result:
-                    required_combs = "\nor:\n".\
-                        join(str(comb).strip('()[]') for comb in self._required)
-                    raise RequiredParamsMissingError(
-                        f'Not all required params are supplied. '
-                        f'Required parameter combinations are:\n{required_combs}')
+        for key in self._common_keys(self._validators):
+            self._validate_key(key)
+        self._validate_required()
+
+    def _validate_key(self, key: str) -> None:
+        '''
+        Validate single option with its validator, if it is supplied.
+        Raises ValidationError if the check fails.
+        '''
+        if key in self._validators:
+            try:
+                self._validators[key](self.options[key])
+            except ValidationError as e:
+                raise ValidationError(f'Error in option "{key}": {e}')
+
+    def _validate_required(self) -> None:
+        '''
+        Check for required params.
+        Raises RequiredParamsMissingError if required params are not supplied.
+        '''
+        if not self._required_sets:
+            return
+        opts_keys = self.options.keys()
+        if any(opts_keys >= comb for comb in self._required_sets):
+            return
+        if isinstance(self._required[0], str):
+            raise RequiredParamsMissingError(
+                f'Not all required params are supplied: {self._required}')
+        else:  # several combinations of required params are possible
+            required_combs = "\nor:\n".\
+                join(str(comb).strip('()[]') for comb in self._required)
+            raise RequiredParamsMissingError(
+                f'Not all required params are supplied. '
+                f'Required parameter combinations are:\n{required_combs}')
+
+    def _get_required_sets(self) -> List[FrozenSet[str]]:
+        '''
+        Return required param combinations from self._required as a list of
+        frozensets for the required params check.
+        '''
+        if not self._required:
+            return []
+        if isinstance(self._required[0], str):
+            return [frozenset(cast(List[str], self._required))]
+        return [frozenset(comb) for comb in self._required]
 
     def _convert(self) -> None:
         '''
@@ -101,10 +123,20 @@ class Options:
         if not self._convertors:
             return
 
-        for key in self._convertors:
-            if key in self.options:
-                convertor = self._convertors[key]
-                self.options[key] = convertor(self.options[key])
+        for key in self._common_keys(self._convertors):
+            convertor = self._convertors[key]
+            self.options[key] = convertor(self.options[key])
+
+    def _common_keys(self, funcs: Dict[str, Callable]) -> List[str]:
+        '''
+        Return keys which are present both in `funcs` dictionary (validators
+        or convertors) and in options, iterating over the smaller of the two.
+        '''
+        if not funcs:
+            return []
+        if len(funcs) > len(self._options):
+            return [key for key in self._options if key in funcs]
+        return [key for key in funcs if key in self._options]
 
     def is_default(self, option: str) -> bool:
         '''return True if option value is same as default'''
@@ -119,8 +151,10 @@ class Options:
         return self.options[ind]
 
     def __setitem__(self, ind: str, val: Any):
+        # adding an option can't break the required params check, so only
+        # the changed option is validated
         self.options[ind] = val
-        self.validate()
+        self._validate_key(ind)
 
     def __contains__(self, ind: str) -> bool:
         return ind in self.options
@@ -134,6 +168,16 @@ class Options:
     def get(self, key: str, default: Optional[Any] = None) -> Any:
         return self.options.get(key, default)
 
+    def update(self, options: Dict[str, Any]) -> None:
+        '''
+        Update options with values from `options` dictionary and validate
+        the changed options.
+        '''
+        self.options.update(options)
+        for key in options:
+            self._validate_key(key)
+        self._validate_required()
+
     def keys(self):
         return self.options.keys()
 
@@ -172,6 +216,8 @@ class CombinedOptions(Options):
         self._validators = dict(validators) if validators else {}
         self._convertors = dict(convertors) if convertors else {}
         self._required = list(required) if required else []
+        self._required_sets = self._get_required_sets()
+        self._update_baseline()
 
         if isinstance(priority, (list, tuple)):
             self.priority = list(priority)
@@ -201,17 +247,33 @@ class CombinedOptions(Options):
         self._priority = priority_list
         self.set_options()
 
+    def _update_baseline(self) -> None:
+        '''
+        Combine all options dicts in the order they were defined, ignoring
+        priority. Must be called each time self._options_dict is changed.
+        '''
+        self._baseline: Dict[str, Any] = {}
+        for key in reversed(list(self._options_dict)):
+            self._baseline.update(self._options_dict[key])
+
+    def _copy_defaults(self) -> dict:
+        '''
+        Return a copy of defaults to be used as a base for the active options
+        dict. Top-level dicts and lists are copied, other values are shared.
+        Override this method if defaults contain deeper nested mutables.
+        '''
+        return {k: (v.copy() if isinstance(v, (dict, list)) else v)
+                for k, v in self.defaults.items()}
+
     def set_options(self) -> None:
         '''
         Sets new active options dict with options combined from all options
         dicts with priority according to self.priority.
         '''
 
-        self._options = deepcopy(self.defaults)
-
-        for key in reversed(list(self._options_dict)):
-            if key not in self.priority:
-                self._options.update(self._options_dict[key])
+        self._options = self._copy_defaults()
+        # options from priority dicts in the baseline are overridden below
+        self._options.update(self._baseline)
 
         for priority in reversed(self.priority):
             self._options.update(self._options_dict[priority])
@@ -259,22 +321,28 @@ def val_type(supported: Union[List[Union[type, NoneType]], type]) -> Callable:
 
     MSG = 'Unsupported option value {val}. Must be of type {supported}'
 
-    def validate(val: Any) -> None:
-        for type_ in types:
-            if type_ is None:
-                if val is None:
-                    return
-            elif isinstance(val, type_):
-                return
-        raise ValidationError(MSG.format(val=val, supported=', '.join(str(t) for t in types)))
+    types: List[Optional[type]]
     if supported is None:
         types = [None]
     elif isinstance(supported, type):
         types = [supported]
     elif isinstance(supported, Collection):
-        types = supported  # type: ignore
+        types = list(supported)
     else:
         raise ValueError('`supported` should be a type, None or a collection of types')
+
+    supported_str = ', '.join(str(t) for t in types)
+    type_tuple = tuple(t for t in types if t is not None)
+
+    # choose the validator once, so that each check is a single isinstance call
+    if None in types:
+        def validate(val: Any) -> None:
+            if val is not None and not isinstance(val, type_tuple):
+                raise ValidationError(MSG.format(val=val, supported=supported_str))
+    else:
+        def validate(val: Any) -> None:
+            if not isinstance(val, type_tuple):
+                raise ValidationError(MSG.format(val=val, supported=supported_str))
     return validate
 
 
@@ -288,7 +356,8 @@ def validate_exists(val: Union[str, Path]) -> None:
 def path_convertor(option: Union[str, Path]) -> Path:
     '''convert string to Path'''
     if isinstance(option, str):
-        return Path(yaml.load(option, yaml.Loader))
+        # strip whitespace and quotes, as YAML-quoted strings are allowed here
+        return Path(option.strip().strip('\'"'))
     elif isinstance(option, Path):
         return option
 
@@ -305,6 +374,18 @@ def yaml_to_dict_convertor(option):
         return yaml.load(option, yaml.Loader)
 
 
+_BOOL_STR = {
+    '1': True,
+    '0': False,
+    'y': True,
+    'n': False,
+    'yes': True,
+    'no': False,
+    'true': True,
+    'false': False
+}
+
+
 def boolean_convertor(option: Any) -> bool:
     '''
     Convert option to bool if necessary.
@@ -313,20 +394,10 @@ def boolean_convertor(option: Any) -> bool:
 
     Other types are validated as bool(object)
     '''
-    str_dict = {
-        '1': True,
-        '0': False,
-        'y': True,
-        'n': False,
-        'yes': True,
-        'no': False,
-        'true': True,
-        'false': False
-    }
-    if type(option) == bool:
+    if option is True or option is False:
         return option
-    elif type(option) == str:
-        return str_dict.get(option.lower().strip(), True)
+    elif isinstance(option, str):
+        return _BOOL_STR.get(option.strip().lower(), True)
     else:
         return bool(option)
 
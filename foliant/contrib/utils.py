@@ -1,7 +1,46 @@
 from pathlib import Path
+from typing import Iterable
 from typing import Union
 
 
+def _prepend_bytes(
+    filepath: Union[str, Path],
+    content: bytes,
+    before_yfm: bool,
+    before_heading: bool
+):
+    '''Insert already encoded `content` at the beginning of the file `filepath`.'''
+    with open(filepath, 'rb') as f:
+        source = f.read()
+
+    # detect line endings by the first line break to support CRLF files
+    first_break = source.find(b'\n')
+    newline = b'\r\n' if source[first_break - 1:first_break + 1] == b'\r\n' else b'\n'
+    if newline != b'\n':
+        content = content.replace(b'\r\n', b'\n').replace(b'\n', newline)
+    yfm_start = b'---' + newline
+    yfm_sep = newline + b'---' + newline
+
+    start = 0
+
+    if not before_yfm and source.startswith(yfm_start):
+        yfm_end = source.find(yfm_sep, 1)
+        start = yfm_end + len(yfm_sep) if yfm_end != -1 else 0
+        # add line break for not to break the heading
+        content = newline + content
+    if not before_heading and source.startswith(b'#'):
+        start = source.find(b'\n', 1) + 1
+        if start == 0:
+            start = len(source)
+        # add line break for not to break the heading
+        content = newline + content
+
+    processed_content = source[:start] + content + source[start:]
+
+    with open(filepath, 'wb') as f:
+        f.write(processed_content)
+
+
 def prepend_file(
     filepath: Union[str, Path],
     content: str,
@@ -11,29 +50,32 @@ def prepend_file(
     '''
     Insert `content` at the beginning of the file `filepath`.
 
+    Line endings of the file are kept. If the file uses CRLF line endings,
+    line breaks in `content` are converted to CRLF too.
+
     :param filepath: path to file which needs to be prepended.
     :param content: content to be inserted.
     :before_yfm: if file starts with YAML Front Matter, insert content before it
     :before_heading: if file starts with a heading, insert content before it
     '''
-    with open(filepath, encoding='utf8') as f:
-        source = f.read()
+    _prepend_bytes(filepath, content.encode('utf8'), before_yfm, before_heading)
 
-    start = 0
 
-    if not before_yfm and source.startswith('---\n'):
-        yfm_end = source.find('\n---\n', 1)
-        start = yfm_end + len('\n---\n') if yfm_end != -1 else 0
-        # add line break for not to break the heading
-        content = '\n' + content
-    if not before_heading and source.startswith('#'):
-        start = source.find('\n', 1) + 1
-        if start == 0:
-            start = len(source)
-        # add line break for not to break the heading
-        content = '\n' + content
-
-    processed_content = source[:start] + content + source[start:]
+def prepend_files(
+    filepaths: Iterable[Union[str, Path]],
+    content: str,
+    before_yfm: bool = False,
+    before_heading: bool = True
+):
+    '''
+    Insert `content` at the beginning of each file in `filepaths`. Same as
+    calling `prepend_file` for each file, but `content` is encoded only once.
 
-    with open(filepath, 'w', encoding='utf8') as f:
-        f.write(processed_content)
+    :param filepaths: paths to files which need to be prepended.
+    :param content: content to be inserted.
+    :before_yfm: if file starts with YAML Front Matter, insert content before it
+    :before_heading: if file starts with a heading, insert content before it
+    '''
+    content_b = content.encode('utf8')
+    for filepath in filepaths:
+        _prepend_bytes(filepath, content_b, before_yfm, before_heading)
@@ -61,19 +61,16 @@ class BasePreprocessorExt(BasePreprocessor):
         '''
 
         source = match.string
-        start = max(0, match.start() - limit)  # index of context start
-        end = min(len(source), match.end() + limit)  # index of context end
-        span = match.span()  # indeces of match (start, end)
-        result = '...' if start != 0 else ''  # add ... at beginning if cropped
-        if span[1] - span[0] > limit and not full_tag:  # if tag contents longer than limit
-            bp1 = match.start() + limit // 2
-            bp2 = match.end() - limit // 2
-            result += f'{source[start:bp1]} <...> {source[bp2:end]}'
-        else:
-            result += source[start:end]
-        if end != len(source):  # add ... at the end if cropped
-            result += '...'
-        return result
+        m_start, m_end = match.span()  # indeces of match
+        start = max(0, m_start - limit)  # index of context start
+        end = min(len(source), m_end + limit)  # index of context end
+        pre = '...' if start != 0 else ''  # add ... at beginning if cropped
+        post = '...' if end != len(source) else ''  # add ... at the end if cropped
+        if m_end - m_start > limit and not full_tag:  # if tag contents longer than limit
+            bp1 = m_start + limit // 2
+            bp2 = m_end - limit // 2
+            return ''.join((pre, source[start:bp1], ' <...> ', source[bp2:end], post))
+        return ''.join((pre, source[start:end], post))
 
     def _warning(self,
                  msg: str,
@@ -1,4 +1,6 @@
 import os
+from collections import OrderedDict
+from collections import UserList
 from unittest import TestCase
 from pathlib import Path
 
@@ -70,6 +72,19 @@ class TestFlattenSeq(TestCase):
 
         self.assertEqual(flatten_seq(seq), expected)
 
+    def test_subclasses(self):
+        class Chapter(str):
+            pass
+
+        seq = [Chapter('ch1.md'), OrderedDict([('Title2', 'ch2.md')]), UserList(['ch3.md'])]
+        self.assertEqual(flatten_seq(seq), ['ch1.md', 'ch2.md'])
+
+    def test_deeply_nested(self):
+        seq = ['ch1.md']
+        for _ in range(5000):
+            seq = [seq]
+        self.assertEqual(flatten_seq(seq), ['ch1.md'])
+
 
 class TestChapters(TestCase):
     test_data_path = 'test/test_data/chapters'
@@ -121,6 +136,49 @@ class TestChapters(TestCase):
             with self.assertRaises(ChapterNotFoundError):
                 chapters_obj.get_chapter_by_path(ch4)
 
+    def test_get_chapter_by_path_dir_change(self):
+        chapters = ['ch1.md', 'ch3.md']
+        with chcwd(self.test_data_path):
+            chapters_obj = Chapters(chapters, working_dir='__folianttmp__')
+
+            self.assertEqual(chapters_obj.get_chapter_by_path('__folianttmp__/ch1.md'), 'ch1.md')
+            with self.assertRaises(ChapterNotFoundError):
+                chapters_obj.get_chapter_by_path('src/ch3.md')
+
+            chapters_obj.src_dir = 'src'
+            self.assertEqual(chapters_obj.src_dir, Path('src').resolve())
+            self.assertEqual(chapters_obj.get_chapter_by_path('src/ch3.md'), 'ch3.md')
+
+            chapters_obj.chapters = ['ch3.md']
+            with self.assertRaises(ChapterNotFoundError):
+                chapters_obj.get_chapter_by_path('__folianttmp__/ch1.md')
+
+    def test_get_chapter_by_path_outside_dirs(self):
+        chapters = ['ch1.md']
+        with chcwd(self.test_data_path):
+            chapters_obj = Chapters(chapters, src_dir='src')
+
+            with self.assertRaises(ChapterNotFoundError):
+                chapters_obj.get_chapter_by_path('ch1.md')
+
+    def test_get_chapter_by_path_nested(self):
+        chapters = ['ch1.md', {'Title2': 'ch2.md'}, {'Section': ['ch3.md']}]
+        with chcwd(self.test_data_path):
+            chapters_obj = Chapters(chapters, src_dir='src')
+
+            self.assertEqual(chapters_obj.get_chapter_by_path('src/ch2.md'), 'ch2.md')
+            self.assertEqual(chapters_obj.get_chapter_by_path('src/ch3.md'), 'ch3.md')
+
+    def test_contains(self):
+        chapters = ['ch1.md', {'Title2': 'ch2.md'}]
+        chapters_obj = Chapters(chapters)
+        self.assertIn('ch2.md', chapters_obj)
+        self.assertNotIn('ch3.md', chapters_obj)
+
+        chapters_obj.chapters = ['ch3.md']
+        self.assertIn('ch3.md', chapters_obj)
+        self.assertNotIn('ch2.md', chapters_obj)
+
     def test_paths(self):
         chapters = ['ch1.md', 'ch2.md', {'Title3': 'ch3.md'}, {'Title4': ['ch4.md', 'ch5.md']}]
         flat_chapters = ['ch1.md', 'ch2.md', 'ch3.md', 'ch4.md', 'ch5.md', ]
@@ -163,3 +221,12 @@ class TestChapters(TestCase):
         self.assertEqual(chapters_obj.get_chapter_title('ch7.md'), 'Title7')
         with self.assertRaises(ChapterNotFoundError):
             chapters_obj.get_chapter_title('nonexistant.md')
+
+    def test_get_chapter_title_after_setter(self):
+        chapters_obj = Chapters(['ch1.md', {'Title2': 'ch2.md'}])
+        self.assertEqual(chapters_obj.get_chapter_title('ch2.md'), 'Title2')
+
+        chapters_obj.chapters = [{'New Title': 'ch1.md'}]
+        self.assertEqual(chapters_obj.get_chapter_title('ch1.md'), 'New Title')
+        with self.assertRaises(ChapterNotFoundError):
+            chapters_obj.get_chapter_title('ch2.md')
@@ -102,6 +102,41 @@ class TestOptions(TestCase):
         self.assertFalse(options.is_default('def3'))
         self.assertFalse(options.is_default('key'))
 
+    def test_setitem_validates_key(self):
+        mock_validator1 = Mock(return_value=None)
+        mock_validator2 = Mock(return_value=None)
+        options = Options(
+            {'key1': 'val1', 'key2': 'val2'},
+            validators={'key1': mock_validator1, 'key2': mock_validator2}
+        )
+        mock_validator1.reset_mock()
+        mock_validator2.reset_mock()
+
+        options['key1'] = 'new_val'
+
+        self.assertEqual(options['key1'], 'new_val')
+        mock_validator1.assert_called_once_with('new_val')
+        mock_validator2.assert_not_called()
+
+    def test_setitem_validation_fail(self):
+        def validator(val):
+            if val != 'val':
+                raise ValidationError('Wrong value')
+
+        options = Options({'key': 'val'}, validators={'key': validator})
+        with self.assertRaises(ValidationError):
+            options['key'] = 'wrong'
+
+    def test_update(self):
+        mock_validator = Mock(return_value=None)
+        options = Options({'key1': 'val1'}, validators={'key2': mock_validator})
+
+        options.update({'key1': 'new1', 'key2': 'new2'})
+
+        self.assertEqual(options.options, {'key1': 'new1', 'key2': 'new2'})
+        mock_validator.assert_called_once_with('new2')
+
+
 class TestCombinedOptions(TestCase):
     def test_combine(self):
         options1 = {'key1': 'val1', 'key2': 'val2'}
@@ -171,6 +206,18 @@ class TestCombinedOptions(TestCase):
 
         self.assertEqual(coptions.options, expected2)
 
+    def test_defaults_are_copied(self):
+        defaults = {'list': [1, 2], 'dict': {'key': 'val'}, 'str': 'val'}
+        coptions = CombinedOptions({'o1': {}}, defaults=defaults)
+
+        coptions.options['list'].append(3)
+        coptions.options['dict']['key2'] = 'val2'
+
+        self.assertEqual(defaults, {'list': [1, 2], 'dict': {'key': 'val'}, 'str': 'val'})
+
+        coptions.priority = 'o1'
+        self.assertEqual(coptions.options, defaults)
+
 
 class TestValidateIn(TestCase):
     def test_validation_pass(self):
@@ -231,6 +278,14 @@ class TestValType(TestCase):
         with self.assertRaises(ValidationError):
             validator(val)
 
+    def test_validation_type_or_none(self):
+        supported = [str, None]
+        validator = val_type(supported)
+        validator('string')
+        validator(None)
+        with self.assertRaises(ValidationError):
+            validator(1)
+
 
 class TestValidateExists(TestCase):
     def test_validation_pass_str(self):
@@ -256,6 +311,10 @@ class TestPathConvertor(TestCase):
         converted = path_convertor(Path('file.txt'))
         self.assertEqual(converted, Path('file.txt'))
 
+    def test_quoted_str(self):
+        self.assertEqual(path_convertor(' "my file.txt" '), Path('my file.txt'))
+        self.assertEqual(path_convertor("'my file.txt'"), Path('my file.txt'))
+
 
 class TestBooleanConvertor(TestCase):
     def test_true(self):
@@ -4,6 +4,7 @@ from unittest import TestCase
 from pathlib import Path
 
 from foliant.contrib.utils import prepend_file
+from foliant.contrib.utils import prepend_files
 
 
 def rel_name(path: str):
@@ -88,3 +89,44 @@ Second prepended paragraph\n\n'''
             result = f.read()
 
         self.assertEqual(result, expected)
+
+    def test_yfm_not_before_crlf(self):
+        filepath = TEST_DATA_PATH / 'cp_yfm_crlf.md'
+        with open(filepath, 'wb') as f:
+            f.write(b'---\r\ntitle: x\r\n---\r\n\r\n# Heading\r\nText\r\n')
+
+        prepend_file(filepath, 'Inserted\n', before_yfm=False)
+
+        with open(filepath, 'rb') as f:
+            result = f.read()
+
+        self.assertEqual(
+            result,
+            b'---\r\ntitle: x\r\n---\r\n\r\nInserted\r\n\r\n# Heading\r\nText\r\n'
+        )
+
+    def test_heading_not_before_crlf(self):
+        filepath = TEST_DATA_PATH / 'cp_heading_crlf.md'
+        with open(filepath, 'wb') as f:
+            f.write(b'# Heading\r\nText\r\n')
+
+        prepend_file(filepath, 'Inserted\n', before_heading=False)
+
+        with open(filepath, 'rb') as f:
+            result = f.read()
+
+        self.assertEqual(result, b'# Heading\r\n\r\nInserted\r\nText\r\n')
+
+    def test_prepend_files(self):
+        filepaths = [TEST_DATA_PATH / 'cp_simple.md', TEST_DATA_PATH / 'cp_yfm.md']
+        with open(TEST_DATA_PATH / 'exp_simple.md') as f:
+            expected_simple = f.read()
+        with open(TEST_DATA_PATH / 'exp_yfm_not_before.md') as f:
+            expected_yfm = f.read()
+
+        prepend_files(filepaths, self.content)
+
+        with open(TEST_DATA_PATH / 'cp_simple.md') as f:
+            self.assertEqual(f.read(), expected_simple)
+        with open(TEST_DATA_PATH / 'cp_yfm.md') as f:
+            self.assertEqual(f.read(), expected_yfm)
@@ -6,6 +6,11 @@ from contextlib import contextmanager
 def chcwd(newcwd, *args, **kwargs):
     '''
     Temporary change working directory to `newcwd` (should be rel path)
+
+    The real process cwd is changed on purpose: code under test resolves
+    relative paths with Path.resolve, which only knows about the process cwd.
+    Parallel runners like pytest-xdist use separate processes, so workers
+    don't share it.
     '''
 
     init_cwd = os.getcwd()